@@ -1,3 +1,11 @@
+import io
+import os
+from functools import lru_cache
+from unittest import mock
+
+import matplotlib
+matplotlib.use("Agg", force=True)  # headless: must run before pyplot is imported
+
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -7,39 +15,136 @@ from plotnine import (
 )
 import imfpythonbook as ip
 
+# Set IMF_RENDER=1 to draw every figure; by default tests only build them
+_RENDER = bool(int(os.environ.get("IMF_RENDER", "0")))
+# Screen resolution for the panel demos; raise (e.g. to 300) for publication output
+_PANEL_DPI = int(os.environ.get("IMF_PANEL_DPI", "72"))
+
 # Setup
 x = np.linspace(0, 10, 100)
 df = pd.DataFrame({"x": x, "sinx": np.sin(x), "cosx": np.cos(x), "tanx": np.tan(x)})
 df_bar = pd.DataFrame({"category": ["A", "B", "C", "D"], "value": [3, 1, 4, 2]})
 
+# Synthetic WEO demo data (fixed seeds, so build once and reuse across tests)
+WEO_YEARS = np.arange(2000, 2026)
+WEO_UNEMP_COUNTRIES = ("BRA", "CHL", "COL", "MEX", "PER")
+WEO_GDP_COUNTRIES = ("BRA", "CHL", "COL", "MEX")
+
+@lru_cache(maxsize=None)
+def _weo_unemp_data(seed=42, n_years=len(WEO_YEARS), countries=WEO_UNEMP_COUNTRIES):
+    """Random-walk unemployment changes, shape (countries, years)."""
+    rng = np.random.default_rng(seed)
+    vals = rng.standard_normal((len(countries), n_years)).cumsum(axis=1)
+    vals.flags.writeable = False
+    return vals
+
+def _long_frame(vals, countries):
+    """Stack a (countries, years) array into a long (year, country, value) frame."""
+    n_years = vals.shape[1]
+    return pd.DataFrame({
+        "year": np.tile(WEO_YEARS[:n_years], len(countries)),
+        "country": np.repeat(countries, n_years),
+        "value": vals.ravel(),
+    })
+
+@lru_cache(maxsize=None)
+def _weo_unemp_frame(seed=42, n_years=len(WEO_YEARS), countries=WEO_UNEMP_COUNTRIES):
+    """Long-format frame of :func:`_weo_unemp_data`."""
+    return _long_frame(_weo_unemp_data(seed, n_years, countries), countries)
+
+@lru_cache(maxsize=None)
+def _weo_gdp_data(seed=123, n_years=len(WEO_YEARS), countries=WEO_GDP_COUNTRIES):
+    """Real GDP index levels (start = 100), shape (countries, years)."""
+    rng = np.random.default_rng(seed)
+    growth = rng.normal(0.02, 0.01, (len(countries), n_years))
+    index = 100 * np.cumprod(1 + growth, axis=1)
+    index.flags.writeable = False
+    return index
+
+@lru_cache(maxsize=None)
+def _weo_gdp_frame(seed=123, n_years=len(WEO_YEARS), countries=WEO_GDP_COUNTRIES):
+    """Long-format frame of :func:`_weo_gdp_data`."""
+    return _long_frame(_weo_gdp_data(seed, n_years, countries), countries)
+
+def _render(p, dpi=None):
+    """Draw a plotnine plot into an in-memory buffer when IMF_RENDER is set."""
+    if _RENDER:
+        p.save(io.BytesIO(), format="png", dpi=dpi, verbose=False)
+
+def _close_figures():
+    """Close all Matplotlib figures, drawing them first when IMF_RENDER is set."""
+    if _RENDER:
+        for num in plt.get_fignums():
+            plt.figure(num).savefig(io.BytesIO(), format="raw")
+    plt.close('all')
+
 # --- IMF_matplotlib Tests ---
 def test_imf_matplotlib_line():
-    ip.matplotlib.set_imf_theme()
-    fig, ax = plt.subplots()
-    ax.plot(x, np.sin(x), color=ip.colors.blue)
-    ip.matplotlib.set_titles(ax, "IMF Theme", "Subtitle")
-    plt.show()
+    # Exercise the global setter, but restore rcParams afterwards
+    with plt.rc_context():
+        ip.matplotlib.set_imf_theme()
+        fig, ax = plt.subplots()
+        ax.plot(x, np.sin(x), color=ip.colors.blue)
+        ip.matplotlib.set_titles(ax, "IMF Theme", "Subtitle")
+        _close_figures()
 
 def test_imf_matplotlib_bar():
-    ip.matplotlib.set_imf_panel_theme()
-    fig, ax = plt.subplots()
-    ax.bar(["A", "B", "C", "D"], [3, 1, 4, 2],
-           color=[ip.colors.blue, ip.colors.green, ip.colors.red, ip.colors.grey])
-    ip.matplotlib.set_panel_titles(ax, "Panel Title", "Panel Subtitle")
-    plt.show()
+    with ip.matplotlib.imf_panel_theme_context():
+        fig, ax = plt.subplots()
+        ax.bar(["A", "B", "C", "D"], [3, 1, 4, 2],
+               color=[ip.colors.blue, ip.colors.green, ip.colors.red, ip.colors.grey])
+        ip.matplotlib.set_panel_titles(ax, "Panel Title", "Panel Subtitle")
+        fig.tight_layout()
+        _close_figures()
 
 def test_imf_matplotlib_annotation():
-    fig, ax = plt.subplots()
-    ax.plot(x, np.cos(x), color=ip.colors.red)
-    # Keep module-specific helpers as-is (not aliased on purpose)
-    ip.IMF_matplotlib.add_text_to_figure(fig, "Figure Caption", y_offset=0.9)
-    plt.show()
+    with ip.matplotlib.imf_theme_context():
+        fig, ax = plt.subplots()
+        ax.plot(x, np.cos(x), color=ip.colors.red)
+        # Keep module-specific helpers as-is (not aliased on purpose)
+        ip.IMF_matplotlib.add_text_to_figure(fig, "Figure Caption", y_offset=0.9)
+        _close_figures()
 
 def test_imf_matplotlib_alt_annotation():
+    with ip.matplotlib.imf_theme_context():
+        fig, ax = plt.subplots()
+        ax.plot(x, np.tan(x), color=ip.colors.green)
+        ip.IMF_matplotlib.add_text_to_figure_new(fig, "Centered Caption", y_offset=0.8)
+        _close_figures()
+
+def _caption_figure(blit):
+    # Blitting needs a real (Agg) canvas, so use a pyplot figure here
     fig, ax = plt.subplots()
-    ax.plot(x, np.tan(x), color=ip.colors.green)
-    ip.IMF_matplotlib.add_text_to_figure_new(fig, "Centered Caption", y_offset=0.8)
-    plt.show()
+    ax.plot(x, np.sin(x), color=ip.colors.blue)
+    ip.IMF_matplotlib.add_text_to_figure(fig, "First caption", y_offset=0.9, blit=blit)
+    return fig
+
+def _raw_pixels(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="raw")
+    return buf.getvalue()
+
+def test_imf_matplotlib_blit_caption():
+    with ip.matplotlib.imf_theme_context():
+        # Saved output must not depend on blit mode (caption drawn exactly once)
+        assert _raw_pixels(_caption_figure(blit=True)) == _raw_pixels(_caption_figure(blit=False))
+
+        fig = _caption_figure(blit=True)
+        fig.canvas.draw()  # caches the background
+        with mock.patch.object(fig.canvas, "draw", wraps=fig.canvas.draw) as draw:
+            ip.IMF_matplotlib.update_figure_caption(fig, "Updated caption")
+        draw.assert_not_called()
+        assert fig.axes[-1].texts[0].get_text() == "Updated caption"
+
+        # A second blit caption must not drop the first from screen draws
+        screens = []
+        for blit in (True, False):
+            fig = _caption_figure(blit)
+            ip.IMF_matplotlib.add_text_to_figure(fig, "Second caption", y_offset=0.2, blit=blit)
+            fig.canvas.draw()
+            screens.append(bytes(fig.canvas.buffer_rgba()))
+        assert screens[0] == screens[1]
+        _close_figures()
 
 # --- IMF_plotnine Tests ---
 def test_imf_plotnine_line():
@@ -47,10 +152,9 @@ def test_imf_plotnine_line():
         ggplot(df, aes("x", "sinx"))
         + geom_line(color=ip.colors.blue)
         + ip.plotnine.set_imf_theme()
+        + ip.plotnine.set_titles("IMF Theme", "Subtitle")
     )
-    for layer in ip.plotnine.set_titles("IMF Theme", "Subtitle"):
-        p += layer
-    print(p)
+    _render(p)
 
 def test_imf_plotnine_bar():
     p = (
@@ -58,10 +162,9 @@ def test_imf_plotnine_bar():
         + geom_bar(stat="identity" )
         + scale_fill_manual(values=[ip.colors.blue, ip.colors.green, ip.colors.red, ip.colors.grey])
         + ip.plotnine.set_imf_panel_theme()
+        + ip.plotnine.set_panel_titles("Panel Title", "Panel Subtitle")
     )
-    for layer in ip.plotnine.set_panel_titles("Panel Title", "Panel Subtitle"):
-        p += layer
-    print(p)
+    _render(p)
 
 def test_imf_plotnine_annotation():
     p = ip.IMF_plotnine.add_text_to_figure_plotnine(
@@ -70,7 +173,7 @@ def test_imf_plotnine_annotation():
         + ip.plotnine.set_imf_theme(),
         "Caption", y_offset=1.05
     )
-    print(p)
+    _render(p)
 
 def test_imf_plotnine_alt_annotation():
     p = ip.IMF_plotnine.add_text_to_figure_new_plotnine(
@@ -79,21 +182,21 @@ def test_imf_plotnine_alt_annotation():
         + ip.plotnine.set_imf_theme(),
         "Centered Caption", y_offset=1.05
     )
-    print(p)
+    _render(p)
 
 # --- WEO Matplotlib Example Rebuilds ---
 def test_weo_theme_unemployment_demo():
     from imfpythonbook.WEO_matplotlib import (
         set_weo_theme, add_y_ticks, add_x_end_ticks, add_weo_title,
-        generate_breaks_auto, weo_colors, weo_text_size
+        generate_breaks_auto_2d, weo_colors, weo_text_size
     )
 
     set_weo_theme()
-    years = np.arange(2000, 2026)
-    countries = ['BRA', 'CHL', 'COL', 'MEX', 'PER']
-    np.random.seed(42)
-    data = {c: np.random.randn(len(years)).cumsum() for c in countries}
-    breaks = generate_breaks_auto(np.concatenate(list(data.values())))
+    years = WEO_YEARS
+    countries = WEO_UNEMP_COUNTRIES
+    vals = _weo_unemp_data()
+    data = dict(zip(countries, vals))  # row views, not copies
+    breaks = generate_breaks_auto_2d(vals)
 
     fig, ax = plt.subplots(figsize=(8, 4), dpi=100)
     for i, country in enumerate(countries):
@@ -104,8 +207,7 @@ def test_weo_theme_unemployment_demo():
     ax.set_yticks(breaks['major'])
     ax.set_ylim(breaks['limits'])
 
-    for spine in ['top', 'left', 'right']:
-        ax.spines[spine].set_visible(False)
+    ax.spines[['top', 'left', 'right']].set_visible(False)
     ax.spines['bottom'].set_linewidth(0.4)
     ax.grid(False)
 
@@ -124,24 +226,22 @@ def test_weo_theme_unemployment_demo():
     ax.text(0, -0.25, "Source: IMF WEO and staff calculations.", transform=ax.transAxes, ha='left', fontsize=weo_text_size)
 
     plt.tight_layout()
-    plt.show()
+    _close_figures()
 
 def test_weo_theme_gdp_panel_demo():
     from imfpythonbook.WEO_matplotlib import (
-        set_weo_panel_theme, add_y_ticks, add_x_end_ticks, add_forecast_shading,
-        generate_breaks_auto, weo_colors, blue
+        set_weo_panel_theme, add_weo_frame_ticks, add_forecast_shading,
+        generate_breaks_auto_2d, weo_colors, blue
     )
 
-    years = np.arange(2000, 2026)
-    countries = ['BRA', 'CHL', 'COL', 'MEX']
-    np.random.seed(123)
-    growth = {c: np.random.normal(0.02, 0.01, len(years)) for c in countries}
-    index = {c: 100 * np.cumprod(1 + growth[c]) for c in countries}
-    combined = np.concatenate([index[c] for c in countries])
-    breaks = generate_breaks_auto(combined)
+    years = WEO_YEARS
+    countries = WEO_GDP_COUNTRIES
+    index_vals = _weo_gdp_data()
+    index = dict(zip(countries, index_vals))  # row views, not copies
+    breaks = generate_breaks_auto_2d(index_vals)
 
     set_weo_panel_theme()
-    fig, axs = plt.subplots(2, 2, figsize=(10, 6), sharey=True)
+    fig, axs = plt.subplots(2, 2, figsize=(10, 6), dpi=_PANEL_DPI, sharey=True)
     axs_flat = axs.flatten()
 
     for ax, country in zip(axs_flat, countries):
@@ -151,13 +251,11 @@ def test_weo_theme_gdp_panel_demo():
         ax.set_yticks(breaks['major'])
         ax.set_ylim(breaks['limits'])
 
-        for spine in ['top', 'left', 'right']:
-            ax.spines[spine].set_visible(False)
+        ax.spines[['top', 'left', 'right']].set_visible(False)
         ax.spines['bottom'].set_linewidth(0.4)
         ax.grid(False)
 
-        add_y_ticks(ax, breaks['major'], breaks['minor'], years.min(), years.max())
-        add_x_end_ticks(ax, years.min(), years.max())
+        add_weo_frame_ticks(ax, breaks['major'], breaks['minor'], years.min(), years.max())
         ax.set_title(country, loc='left', fontsize=8, fontweight='bold')
         add_forecast_shading(ax, start_year=2022, end_year=2025, y_range=breaks['limits'])
 
@@ -168,7 +266,7 @@ def test_weo_theme_gdp_panel_demo():
              ha='left', fontsize=8)
 
     plt.tight_layout(rect=[0, 0, 1, 0.90])
-    plt.show()
+    _close_figures()
 
 # --- WEO Plotnine Example Rebuilds ---
 def test_weo_plotnine_unemployment_demo():
@@ -176,19 +274,8 @@ def test_weo_plotnine_unemployment_demo():
         set_weo_theme_plotnine, generate_breaks_auto, weo_colors
     )
 
-    years = list(range(2000, 2026))
-    countries = ['BRA', 'CHL', 'COL', 'MEX', 'PER']
-    np.random.seed(42)
-    data = {"year": [], "country": [], "value": []}
-
-    for i, c in enumerate(countries):
-        vals = np.random.randn(len(years)).cumsum()
-        data["year"] += years
-        data["country"] += [c] * len(years)
-        data["value"] += list(vals)
-
-    df = pd.DataFrame(data)
-    breaks = generate_breaks_auto(df["value"])
+    df = _weo_unemp_frame()
+    breaks = generate_breaks_auto(df["value"].to_numpy())
 
     p = (
         ggplot(df, aes("year", "value", color="country"))
@@ -201,7 +288,7 @@ def test_weo_plotnine_unemployment_demo():
             caption="Source: IMF WEO and staff calculations."
         )
     )
-    print(p)
+    _render(p)
 
 def test_weo_plotnine_gdp_panel_demo():
     from imfpythonbook.WEO_plotnine import (
@@ -211,22 +298,8 @@ def test_weo_plotnine_gdp_panel_demo():
         blue
     )
 
-    years = list(range(2000, 2026))
-    countries = ['BRA', 'CHL', 'COL', 'MEX']
-    np.random.seed(123)
-    df = []
-
-    for country in countries:
-        growth = np.random.normal(0.02, 0.01, len(years))
-        index = 100 * np.cumprod(1 + growth)
-        df.append(pd.DataFrame({
-            "year": years,
-            "value": index,
-            "country": country
-        }))
-
-    df = pd.concat(df)
-    breaks = generate_breaks_auto(df["value"])
+    df = _weo_gdp_frame()
+    breaks = generate_breaks_auto(df["value"].to_numpy())
 
     p = (
         ggplot(df, aes("year", "value"))
@@ -241,22 +314,51 @@ def test_weo_plotnine_gdp_panel_demo():
             caption="Source: Synthetic data. Real GDP index rebased to 2010=100."
         )
     )
-    print(p)
+    _render(p, dpi=_PANEL_DPI)
 
-# --- Entry Point ---
-if __name__ == "__main__":
-    test_imf_matplotlib_line()
-    test_imf_matplotlib_bar()
-    test_imf_matplotlib_annotation()
-    test_imf_matplotlib_alt_annotation()
+def test_weo_plotnine_faceted_y_ticks():
+    from imfpythonbook.WEO_plotnine import (
+        generate_breaks_auto_2d, make_y_tick_segments, make_y_tick_segments_faceted
+    )
 
-    test_imf_plotnine_line()
-    test_imf_plotnine_bar()
-    test_imf_plotnine_annotation()
-    test_imf_plotnine_alt_annotation()
+    breaks = generate_breaks_auto_2d(_weo_gdp_data())
+    args = (breaks["major"], breaks["minor"], WEO_YEARS.min(), WEO_YEARS.max())
+    faceted = make_y_tick_segments_faceted(*args, WEO_GDP_COUNTRIES, label_column="country")
+    # Per-facet reference: one frame per label, concatenated
+    expected = pd.concat(
+        [make_y_tick_segments(*args).assign(country=c) for c in WEO_GDP_COUNTRIES],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(faceted, expected)
 
-    test_weo_theme_unemployment_demo()
-    test_weo_theme_gdp_panel_demo()
+# --- Entry Point ---
+TESTS = [
+    test_imf_matplotlib_line,
+    test_imf_matplotlib_bar,
+    test_imf_matplotlib_annotation,
+    test_imf_matplotlib_alt_annotation,
+    test_imf_matplotlib_blit_caption,
+
+    test_imf_plotnine_line,
+    test_imf_plotnine_bar,
+    test_imf_plotnine_annotation,
+    test_imf_plotnine_alt_annotation,
+
+    test_weo_theme_unemployment_demo,
+    test_weo_theme_gdp_panel_demo,
+
+    test_weo_plotnine_unemployment_demo,
+    test_weo_plotnine_gdp_panel_demo,
+    test_weo_plotnine_faceted_y_ticks,
+]
+
+def _run(fn):
+    # Matplotlib state is process-global, so each test runs in its own worker
+    # process; the Agg backend is selected when the worker imports this module.
+    fn()
+
+if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
 
-    test_weo_plotnine_unemployment_demo()
-    test_weo_plotnine_gdp_panel_demo()
+    with ProcessPoolExecutor() as ex:
+        list(ex.map(_run, TESTS))
@@ -13,15 +13,20 @@ set_imf_theme(myfont, myfontColor)
     Apply the IMF “classic” theme to Matplotlib rcParams with a full rectangle border in light_grey.
 set_imf_panel_theme(myfont, myfontColor)
     Apply the IMF panel theme (smaller text) to Matplotlib rcParams with a full rectangle border in light_grey.
+imf_theme_context(myfont, myfontColor), imf_panel_theme_context(myfont, myfontColor)
+    Same themes as context managers: rcParams are restored when the ``with`` block exits.
 apply_imf_titles(ax, title, subtitle=None)
     Helper to set both title (18pt bold) and subtitle (16pt normal) left-aligned in blue above the plot area.
 apply_imf_panel_titles(ax, title, subtitle=None)
     Helper to set panel-title (14pt bold) and panel-subtitle (12pt normal) left-aligned in blue above the plot area.
-add_text_to_figure(fig, text, y_offset)
+add_text_to_figure(fig, text, y_offset, blit=False)
     Add an italic caption above a figure.
+update_figure_caption(fig, text)
+    Change a caption added with ``blit=True``, redrawing only the caption.
 add_text_to_figure_new(fig, text, y_offset)
     Alternate version: centers the caption and stacks via GridSpec.
 """
+from functools import lru_cache
 import os
 os.environ.setdefault('MPLBACKEND', 'Agg')
 import matplotlib.pyplot as plt
@@ -29,91 +34,110 @@ from matplotlib import rcParams
 from matplotlib.gridspec import GridSpec
 import numpy as np
 
-# Colour definitions (0–255 -> hex)
+# Colour definitions (0–255 -> hex), precomputed as literals
+@lru_cache(maxsize=256, typed=True)
 def rgb2(r, g, b):
-    return "#{:02x}{:02x}{:02x}".format(r, g, b)
-
-blue        = rgb2(75,130,173)
-green       = rgb2(150,186,121)
-red         = rgb2(192,0,80)
-grey        = rgb2(166,168,172)
-light_green = rgb2(150,215,130)
-light_grey  = rgb2(211,211,211)
-light_red   = rgb2(238,36,0)
-dark_red    = rgb2(144,0,0)
-light_blue  = rgb2(202,224,251)
-dark_blue   = rgb2(14,16,116)
-purple      = rgb2(146,60,194)
-orange      = rgb2(255,133,71)
+    return "#%02x%02x%02x" % (r, g, b)
+
+blue        = "#4b82ad"  # rgb2(75, 130, 173)
+green       = "#96ba79"  # rgb2(150, 186, 121)
+red         = "#c00050"  # rgb2(192, 0, 80)
+grey        = "#a6a8ac"  # rgb2(166, 168, 172)
+light_green = "#96d782"  # rgb2(150, 215, 130)
+light_grey  = "#d3d3d3"  # rgb2(211, 211, 211)
+light_red   = "#ee2400"  # rgb2(238, 36, 0)
+dark_red    = "#900000"  # rgb2(144, 0, 0)
+light_blue  = "#cae0fb"  # rgb2(202, 224, 251)
+dark_blue   = "#0e1074"  # rgb2(14, 16, 116)
+purple      = "#923cc2"  # rgb2(146, 60, 194)
+orange      = "#ff8547"  # rgb2(255, 133, 71)
 
 # Palette vectors
 A4_colors     = [blue, green, grey, light_green, light_grey, light_red, dark_red]
 A4_colors_bar = [blue, green, red, grey, "black", light_green, light_grey, light_red, dark_red]
 
+# Theme rcParams that do not depend on the font arguments, built once at import
+_IMF_THEME_BASE = {
+    "font.size": 14,
+    # Full border (all four spines)
+    "axes.spines.top": True,
+    "axes.spines.right": True,
+    "axes.spines.left": True,
+    "axes.spines.bottom": True,
+    # Border styling
+    "axes.edgecolor": light_grey,
+    "axes.linewidth": 1,
+    # Title styling defaults (main title)
+    "axes.titlesize": 18,
+    "axes.titleweight": "bold",
+    # Axis labels and ticks
+    "axes.labelsize": 14,
+    "xtick.labelsize": 14,
+    "ytick.labelsize": 14,
+    "xtick.color": "black",
+    "ytick.color": "black",
+    "axes.grid": False,
+    # Figure
+    "figure.facecolor": "white",
+    "figure.autolayout": True,
+    # Legend
+    "legend.fontsize": 12,
+    "legend.frameon": False,
+}
+
+_IMF_PANEL_THEME_BASE = {
+    "font.size": 10,
+    "axes.spines.top": True,
+    "axes.spines.right": True,
+    "axes.spines.left": True,
+    "axes.spines.bottom": True,
+    "axes.edgecolor": light_grey,
+    "axes.linewidth": 1,
+    "axes.labelsize": 10,
+    "xtick.labelsize": 10,
+    "ytick.labelsize": 10,
+    "xtick.color": "black",
+    "ytick.color": "black",
+    "axes.grid": False,
+    "figure.facecolor": "white",
+    "figure.autolayout": False,  # panels call fig.tight_layout() once when done
+    "legend.fontsize": 10,
+    "legend.frameon": False,
+}
+
 # Core theme: classic with IMF tweaks
 def set_imf_theme(myfont="Segoe UI", myfontColor=blue):
     """Apply classic IMF theme with full rectangle border in light_grey."""
-    rcParams.update({
-        # Font
-        "font.family": myfont,
-        "font.size": 14,
-        # Full border (all four spines)
-        "axes.spines.top": True,
-        "axes.spines.right": True,
-        "axes.spines.left": True,
-        "axes.spines.bottom": True,
-        # Border styling
-        "axes.edgecolor": light_grey,
-        "axes.linewidth": 1,
-        # Title styling defaults (main title)
-        "axes.titlesize": 18,
-        "axes.titleweight": "bold",
-        "axes.titlecolor": myfontColor,
-        # Axis labels and ticks
-        "axes.labelsize": 14,
-        "xtick.labelsize": 14,
-        "ytick.labelsize": 14,
-        "xtick.color": "black",
-        "ytick.color": "black",
-        "axes.grid": False,
-        # Figure
-        "figure.facecolor": "white",
-        "figure.autolayout": True,
-        # Legend
-        "legend.fontsize": 12,
-        "legend.frameon": False,
-    })
+    rcParams.update(_IMF_THEME_BASE)
+    rcParams["font.family"] = myfont
+    rcParams["axes.titlecolor"] = myfontColor
 
 # Panel theme: similar but smaller text
 def set_imf_panel_theme(myfont="Segoe UI", myfontColor=blue):
-    """Apply IMF panel theme with full rectangle border in light_grey and smaller text."""
-    rcParams.update({
-        "font.family": myfont,
-        "font.size": 10,
-        "axes.spines.top": True,
-        "axes.spines.right": True,
-        "axes.spines.left": True,
-        "axes.spines.bottom": True,
-        "axes.edgecolor": light_grey,
-        "axes.linewidth": 1,
-        "axes.labelsize": 10,
-        "xtick.labelsize": 10,
-        "ytick.labelsize": 10,
-        "xtick.color": "black",
-        "ytick.color": "black",
-        "axes.grid": False,
-        "figure.facecolor": "white",
-        "figure.autolayout": True,
-        "legend.fontsize": 10,
-        "legend.frameon": False,
+    """
+    Apply IMF panel theme with full rectangle border in light_grey and smaller text.
+
+    Automatic layout is off so multi-axes panels are not re-laid out on every
+    draw; call ``fig.tight_layout()`` once after the panel is complete.
+    """
+    rcParams.update(_IMF_PANEL_THEME_BASE)
+    rcParams["font.family"] = myfont
+
+# Scoped variants: apply a theme only inside a ``with`` block
+def imf_theme_context(myfont="Segoe UI", myfontColor=blue):
+    """Return an rc_context that applies the classic IMF theme and reverts it on exit."""
+    return plt.rc_context({
+        **_IMF_THEME_BASE, "font.family": myfont, "axes.titlecolor": myfontColor,
     })
 
+def imf_panel_theme_context(myfont="Segoe UI", myfontColor=blue):
+    """Return an rc_context that applies the IMF panel theme and reverts it on exit."""
+    return plt.rc_context({**_IMF_PANEL_THEME_BASE, "font.family": myfont})
+
 # Helper: apply title and subtitle above plot for standard theme
 def apply_imf_titles(ax, title, subtitle=None):
     """Set main title (18pt bold) and subtitle (16pt normal) left-aligned above the plot."""
-    for loc in ['top', 'right', 'bottom', 'left']:
-        ax.spines[loc].set_edgecolor(light_grey)
-        ax.spines[loc].set_linewidth(rcParams['axes.linewidth'])
+    ax.spines[:].set(edgecolor=light_grey, linewidth=rcParams['axes.linewidth'])
     ax.set_title(
         title,
         loc='left',
@@ -135,9 +159,7 @@ def apply_imf_titles(ax, title, subtitle=None):
 # Helper: apply title and subtitle above plot for panel theme
 def apply_imf_panel_titles(ax, title, subtitle=None):
     """Set panel title (14pt bold) and subtitle (12pt normal) left-aligned above the plot."""
-    for loc in ['top', 'right', 'bottom', 'left']:
-        ax.spines[loc].set_edgecolor(light_grey)
-        ax.spines[loc].set_linewidth(rcParams['axes.linewidth'])
+    ax.spines[:].set(edgecolor=light_grey, linewidth=rcParams['axes.linewidth'])
     ax.set_title(
         title,
         loc='left',
@@ -157,25 +179,84 @@ def apply_imf_panel_titles(ax, title, subtitle=None):
         )
 
 # Add caption above figure
-def add_text_to_figure(fig, text, y_offset=0.38, primary_font="Segoe UI"):
-    """Place an italic caption above the figure using GridSpec."""
-    fig.canvas.draw()
+def add_text_to_figure(fig, text, y_offset=0.38, primary_font="Segoe UI", blit=False):
+    """
+    Place an italic caption above the figure using GridSpec.
+
+    With ``blit=True`` the caption is kept out of the cached figure background,
+    so :func:`update_figure_caption` can redraw just the caption on interactive
+    canvases instead of re-rendering the whole figure.
+    """
     gs = GridSpec(2, 1, height_ratios=[1, 5], figure=fig)
+    # GridSpec positions are known analytically; no render pass is needed
+    plot_pos = gs[1].get_position(fig)
     for ax in fig.axes:
-        ax.set_position(gs[1].get_position(fig))
+        ax.set_position(plot_pos)
     txt_ax = fig.add_subplot(gs[0])
     txt_ax.axis("off")
-    txt_ax.text(
+    txt = txt_ax.text(
         0.5, y_offset, text,
         ha="center", va="center",
         fontsize=12, fontfamily=primary_font,
-        fontstyle="italic", color="black"
+        fontstyle="italic", color="black", animated=blit
     )
+    if blit:
+        # One blitter per figure, so earlier blit captions keep being drawn
+        blitter = getattr(fig, "_imf_caption", None)
+        if blitter is None:
+            blitter = fig._imf_caption = _CaptionBlitter(fig)
+        blitter.texts.append(txt)
+    return fig
+
+class _CaptionBlitter:
+    """Cache the figure background on each full draw and blit the captions over it."""
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.texts = []
+        self.background = None
+        fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        # savefig already draws animated artists, so only handle screen draws
+        if event.canvas.is_saving():
+            return
+        if event.canvas.supports_blit:
+            self.background = event.canvas.copy_from_bbox(self.fig.bbox)
+        for txt in self.texts:
+            txt.draw(event.renderer)
+
+    def update(self, text, index=-1):
+        self.texts[index].set_text(text)
+        canvas = self.fig.canvas
+        if self.background is None:
+            # Nothing cached yet: one full draw, which also caches the background
+            canvas.draw()
+            return
+        # The background holds none of the captions, so redraw all of them
+        canvas.restore_region(self.background)
+        for txt in self.texts:
+            self.fig.draw_artist(txt)
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+def update_figure_caption(fig, text, index=-1):
+    """
+    Replace the caption text of a figure captioned with ``add_text_to_figure(..., blit=True)``.
+
+    ``index`` selects the caption when several were added; the latest by default.
+    """
+    blitter = getattr(fig, "_imf_caption", None)
+    if blitter is None:
+        raise ValueError(
+            "figure has no blit-enabled caption; "
+            "use add_text_to_figure(fig, text, blit=True) first"
+        )
+    blitter.update(text, index)
     return fig
 
-# Alternate caption version
-def add_text_to_figure_new(fig, text, y_offset=0.38, primary_font="Segoe UI"):
-    return add_text_to_figure(fig, text, y_offset=y_offset, primary_font=primary_font)
+# Alias for alternative caption version
+add_text_to_figure_new = add_text_to_figure
 
 # Demonstrations
 if __name__ == "__main__":
@@ -193,6 +274,7 @@ if __name__ == "__main__":
     fig, ax = plt.subplots()
     ax.bar(["A","B","C","D"],[3,1,4,2], color=[blue, green, red, grey])
     apply_imf_panel_titles(ax, "IMF Panel Theme Title", "Panel Subtitle")
+    fig.tight_layout()
     plt.show()
 
     # 3. Text annotation demo
@@ -9,6 +9,9 @@ Provides:
 - Simple built-in tests for core functions
 """
 
+from copy import deepcopy
+from functools import lru_cache
+
 from plotnine import (
     ggplot, aes, geom_line, geom_bar, scale_fill_manual,
     theme_classic, theme, element_text, element_rect, element_line,
@@ -17,23 +20,24 @@ from plotnine import (
 import numpy as np
 import pandas as pd
 
-# Colour definitions (0–255 -> hex)
+# Colour definitions (0–255 -> hex), precomputed as literals
+@lru_cache(maxsize=256, typed=True)
 def rgb2(r, g, b):
     """Convert integer RGB values (0–255) to hex string."""
-    return "#{:02x}{:02x}{:02x}".format(r, g, b)
-
-blue        = rgb2(75, 130, 173)
-green       = rgb2(150, 186, 121)
-red         = rgb2(192,   0,  80)
-grey        = rgb2(166, 168, 172)
-light_green = rgb2(150, 215, 130)
-light_grey  = rgb2(211, 211, 211)
-light_red   = rgb2(238,  36,   0)
-dark_red    = rgb2(144,   0,   0)
-light_blue  = rgb2(202, 224, 251)
-dark_blue   = rgb2( 14,  16, 116)
-purple      = rgb2(146,  60, 194)
-orange      = rgb2(255, 133,  71)
+    return "#%02x%02x%02x" % (r, g, b)
+
+blue        = "#4b82ad"  # rgb2(75, 130, 173)
+green       = "#96ba79"  # rgb2(150, 186, 121)
+red         = "#c00050"  # rgb2(192, 0, 80)
+grey        = "#a6a8ac"  # rgb2(166, 168, 172)
+light_green = "#96d782"  # rgb2(150, 215, 130)
+light_grey  = "#d3d3d3"  # rgb2(211, 211, 211)
+light_red   = "#ee2400"  # rgb2(238, 36, 0)
+dark_red    = "#900000"  # rgb2(144, 0, 0)
+light_blue  = "#cae0fb"  # rgb2(202, 224, 251)
+dark_blue   = "#0e1074"  # rgb2(14, 16, 116)
+purple      = "#923cc2"  # rgb2(146, 60, 194)
+orange      = "#ff8547"  # rgb2(255, 133, 71)
 
 # Palette vectors
 A4_colors     = [blue, green, grey, light_green, light_grey, light_red, dark_red]
@@ -48,6 +52,12 @@ def set_imf_theme_plotnine(font="Segoe UI", font_color=blue):
     Return a Plotnine theme matching IMF classic style (full border),
     including axis ticks, grid, and border settings per IMF guidelines.
     """
+    # Copy the cached theme: ggplot adopts a complete theme as-is, so a
+    # later `p += theme(...)` would otherwise modify the cached instance.
+    return deepcopy(_build_imf_theme_plotnine(font, font_color))
+
+@lru_cache(maxsize=8)
+def _build_imf_theme_plotnine(font, font_color):
     return (
         theme_classic()
         + theme(
@@ -79,6 +89,10 @@ def set_imf_panel_theme_plotnine(font="Segoe UI", font_color=blue):
     """
     Return a Plotnine theme matching IMF panel style (full border, smaller text).
     """
+    return deepcopy(_build_imf_panel_theme_plotnine(font, font_color))
+
+@lru_cache(maxsize=8)
+def _build_imf_panel_theme_plotnine(font, font_color):
     return (
         theme_classic()
         + theme(
@@ -107,11 +121,10 @@ def set_imf_panel_theme_plotnine(font="Segoe UI", font_color=blue):
 
 # Title/subtitle helpers
 def apply_imf_titles_plotnine(title, subtitle=None):
-    """Return labs layers for main title and optional subtitle."""
-    layers = [labs(title=title)]
+    """Return a single labs layer for main title and optional subtitle."""
     if subtitle:
-        layers.append(labs(subtitle=subtitle))
-    return layers
+        return labs(title=title, subtitle=subtitle)
+    return labs(title=title)
 
 def apply_imf_panel_titles_plotnine(title, subtitle=None):
     """Same as apply_imf_titles_plotnine (panel uses same logic)."""
@@ -161,9 +174,8 @@ if __name__ == "__main__":
         ggplot(df, aes('x', 'sinx'))
         + geom_line(color=blue)
         + set_imf_theme_plotnine()
+        + apply_imf_titles_plotnine("IMF Theme", "Subtitle")
     )
-    for layer in apply_imf_titles_plotnine("IMF Theme", "Subtitle"):
-        p1 += layer
     print(p1)
 
     # 2. IMF panel theme bar chart with panel title & subtitle
@@ -173,9 +185,8 @@ if __name__ == "__main__":
         + geom_bar(stat='identity')
         + scale_fill_manual(values=[blue, green, red, grey])
         + set_imf_panel_theme_plotnine()
+        + apply_imf_panel_titles_plotnine("IMF Panel Theme Title", "Panel Subtitle")
     )
-    for layer in apply_imf_panel_titles_plotnine("IMF Panel Theme Title", "Panel Subtitle"):
-        p2 += layer
     print(p2)
 
     # 3. Text annotation demo
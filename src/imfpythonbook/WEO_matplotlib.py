@@ -1,27 +1,12 @@
 import matplotlib.pyplot as plt
 import matplotlib as mpl
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Rectangle
 import numpy as np
 
-def rgb2(red, green, blue):
-    """Convert RGB values (0-255) to hex color."""
-    return '#{:02x}{:02x}{:02x}'.format(red, green, blue)
-
-# WEO color palette
-blue        = rgb2(0, 98, 175)
-red         = rgb2(170, 31, 76)
-gold        = rgb2(245, 189, 71)
-green       = rgb2(73, 117, 39)
-light_grey  = rgb2(200, 200, 200)
-light_blue  = rgb2(141, 163, 210)
-light_red   = rgb2(209, 145, 131)
-light_gold  = rgb2(249, 219, 161)
-light_green = rgb2(162, 176, 143)
-dark_grey   = rgb2(150, 150, 150)
-black       = rgb2(0, 0, 0)
-
-weo_colors = [blue, red, gold, green, light_grey, light_blue, light_red,
-              light_gold, light_green, dark_grey]
+# WEO palette and break helpers (shared with WEO_plotnine)
+from ._weo_core import *
+from ._weo_core import _TICK_DEFAULTS
 
 # Font and sizing
 primary_font_weo = 'Arial'
@@ -86,71 +71,56 @@ def set_weo_panel_theme(font=primary_font_weo, font_color=black):
         'legend.fontsize': 6.5,
     })
 
-def generate_minor_breaks(major_breaks):
-    """Generate one minor break between each pair of major breaks."""
-    major = np.asarray(major_breaks)
-    return (major[:-1] + np.diff(major) / 2).tolist()
-
-def generate_breaks_auto(y, major_by=None):
-    """Generate clean major and minor breaks from Y data range."""
-    y = np.asarray(y)
-    y = y[~np.isnan(y)]
-    if y.size == 0:
-        return {'major': [], 'minor': [], 'limits': [0, 1]}
-    y_min, y_max = y.min(), y.max()
-    y_span = y_max - y_min
-    if major_by is None:
-        if y_span <= 5:
-            major_by = 1
-        elif y_span <= 10:
-            major_by = 2
-        elif y_span <= 20:
-            major_by = 5
-        elif y_span <= 50:
-            major_by = 10
-        else:
-            major_by = 20
-    min_y = np.floor(y_min / major_by) * major_by
-    max_y = np.ceil(y_max / major_by) * major_by
-    major = np.arange(min_y, max_y + major_by, major_by)
-    minor = generate_minor_breaks(major)
-    return {'major': major.tolist(), 'minor': minor, 'limits': [min_y, max_y]}
-
 def add_y_ticks(ax, major_breaks, minor_breaks, x_min, x_max,
                 style='default', major_length=None, minor_length=None,
                 major_size=0.4, minor_size=0.3):
     """Add both major and minor Y ticks on left and right (R-matched defaults)."""
-    style = style.lower()
-
-    if style == 'bar':
-        if major_length is None:
-            major_length = 0.10
-        if minor_length is None:
-            minor_length = 0.06
-    else:
-        if major_length is None:
-            major_length = 0.15
-        if minor_length is None:
-            minor_length = 0.10
-
-    for y in minor_breaks:
-        ax.plot([x_min, x_min + minor_length], [y, y],
-                linewidth=minor_size, color='black')
-        ax.plot([x_max - minor_length, x_max], [y, y],
-                linewidth=minor_size, color='black')
-
-    for y in major_breaks:
-        ax.plot([x_min, x_min + major_length], [y, y],
-                linewidth=major_size, color='black')
-        ax.plot([x_max - major_length, x_max], [y, y],
-                linewidth=major_size, color='black')
+    default_major, default_minor = _TICK_DEFAULTS.get(style.lower(), _TICK_DEFAULTS['default'])
+    major_length = default_major if major_length is None else major_length
+    minor_length = default_minor if minor_length is None else minor_length
+
+    minor = _y_tick_segments(minor_breaks, x_min, x_max, minor_length)
+    major = _y_tick_segments(major_breaks, x_min, x_max, major_length)
+    _add_tick_collection(ax, np.concatenate([minor, major]),
+                         _tick_widths((len(minor), minor_size), (len(major), major_size)))
+
+def _add_tick_collection(ax, segs, widths):
+    """Add tick segments as one LineCollection with per-segment line widths."""
+    # zorder 2 keeps ticks level with plotted lines; autolim=False skips a relim
+    ax.add_collection(
+        LineCollection(segs, linewidths=widths, colors='black', zorder=2),
+        autolim=False,
+    )
+
+def _tick_widths(*groups):
+    """Return a per-segment linewidths array from (count, width) pairs."""
+    counts, widths = zip(*groups)
+    return np.repeat(np.asarray(widths, dtype=np.float64), counts)
+
+def _y_tick_segments(breaks, x_min, x_max, length):
+    """Return (2N, 2, 2) segments for inward ticks at both ends of each break."""
+    y = np.asarray(breaks, dtype=np.float64)
+    n = y.size
+    # Rows of (x0, y0, x1, y1); broadcast_to makes the constant x columns views
+    left = np.stack([np.broadcast_to(x_min, n), y,
+                     np.broadcast_to(x_min + length, n), y], axis=1)
+    right = np.stack([np.broadcast_to(x_max - length, n), y,
+                      np.broadcast_to(x_max, n), y], axis=1)
+    return np.concatenate([left, right]).reshape(2 * n, 2, 2)
 
 def add_forecast_shading(ax, start_year, end_year, y_range=None, fill_color=light_grey):
-    """Add forecast shading to a plot between start_year and end_year."""
+    """
+    Add forecast shading to a plot between start_year and end_year.
+
+    Without ``y_range`` the band spans the full axes height and follows later
+    y-limit changes; with ``y_range`` it covers exactly (ymin, ymax) in data units.
+    """
     if y_range is None:
-        ymin, ymax = ax.get_ylim()
-    else:
-        ymin, ymax = y_range
+        # Axes-fraction height: no get_ylim() query or autoscale flush needed
+        ax.axvspan(start_year, end_year, facecolor=fill_color, alpha=0.3,
+                   edgecolor=None, zorder=0)
+        return
+    ymin, ymax = y_range
     rect = Rectangle((start_year, ymin), end_year - start_year, ymax - ymin,
                      facecolor=fill_color, alpha=0.3, edgecolor=None, zorder=0)
     ax.add_patch(rect)
@@ -194,10 +164,30 @@ def add_x_end_ticks(ax, x_min, x_max,
     Draw inward-facing ticks at the start and end of the X-axis.
     """
     y0, _ = ax.get_ylim()
-    ax.plot([x_min, x_min + major_length], [y0, y0],
-            linewidth=size, color='black')
-    ax.plot([x_max - major_length, x_max], [y0, y0],
-            linewidth=size, color='black')
+    segs = _x_end_tick_segments(x_min, x_max, y0, major_length)
+    _add_tick_collection(ax, segs, size)
+
+def _x_end_tick_segments(x_min, x_max, y0, length):
+    """Return (2, 2, 2) segments for inward ticks at both ends of the X-axis."""
+    return np.array([[[x_min, y0], [x_min + length, y0]],
+                     [[x_max - length, y0], [x_max, y0]]], dtype=np.float64)
+
+def add_weo_frame_ticks(ax, major_y, minor_y, x_min, x_max, style='default',
+                        x_end_length: float = 0.15):
+    """
+    Add minor/major Y ticks and X-axis end ticks as a single artist.
+
+    Equivalent to ``add_y_ticks`` followed by ``add_x_end_ticks`` with their
+    default sizes, but draws one LineCollection per axes instead of several.
+    Call it after the y-limits are set, as the X-end ticks sit at the bottom.
+    """
+    major_length, minor_length = _TICK_DEFAULTS.get(style.lower(), _TICK_DEFAULTS['default'])
+    y0, _ = ax.get_ylim()
+    minor = _y_tick_segments(minor_y, x_min, x_max, minor_length)
+    major = _y_tick_segments(major_y, x_min, x_max, major_length)
+    x_end = _x_end_tick_segments(x_min, x_max, y0, x_end_length)
+    widths = _tick_widths((len(minor), 0.3), (len(major) + len(x_end), 0.4))
+    _add_tick_collection(ax, np.concatenate([minor, major, x_end]), widths)
 
 ### Example charts
 
@@ -213,7 +203,7 @@ def add_x_end_ticks(ax, x_min, x_max,
 #     np.random.seed(42)
 #     data = {c: np.random.randn(len(years)).cumsum() for c in countries}
 
-#     breaks = generate_breaks_auto(np.concatenate(list(data.values())))
+#     breaks = generate_breaks_auto_2d(np.stack(list(data.values())))
 
 #     fig, ax = plt.subplots(figsize=(8, 4), dpi=100)
 
@@ -226,8 +216,7 @@ def add_x_end_ticks(ax, x_min, x_max,
 #             linewidth=1
 #         )
 
-#     for spine in ['top', 'left', 'right']:
-#         ax.spines[spine].set_visible(False)
+#     ax.spines[['top', 'left', 'right']].set_visible(False)
 #     ax.spines['bottom'].set_linewidth(0.4)
 #     ax.grid(False)
 
@@ -280,15 +269,13 @@ def add_x_end_ticks(ax, x_min, x_max,
 #     growth = {c: np.random.normal(0.02, 0.01, len(years)) for c in countries}
 #     index = {c: 100 * np.cumprod(1 + growth[c]) for c in countries}
 
-#     combined = np.concatenate([index[c] for c in countries])
-#     breaks = generate_breaks_auto(combined)
+#     breaks = generate_breaks_auto_2d(np.stack([index[c] for c in countries]))
 
 #     fig, axs = plt.subplots(2, 2, figsize=(10, 6), sharey=True)
 #     axs_flat = axs.flatten()
 
 #     for ax, country in zip(axs_flat, countries):
-#         for spine in ['top', 'left', 'right']:
-#             ax.spines[spine].set_visible(False)
+#         ax.spines[['top', 'left', 'right']].set_visible(False)
 #         ax.spines['bottom'].set_linewidth(0.4)
 #         ax.grid(False)
 
@@ -299,8 +286,7 @@ def add_x_end_ticks(ax, x_min, x_max,
 #         ax.set_yticks(breaks['major'])
 #         ax.set_ylim(breaks['limits'])
 
-#         add_y_ticks(ax, breaks['major'], breaks['minor'], years.min(), years.max())
-#         add_x_end_ticks(ax, years.min(), years.max())
+#         add_weo_frame_ticks(ax, breaks['major'], breaks['minor'], years.min(), years.max())
 
 #         ax.set_title(country, loc='left', fontsize=8, fontweight='bold')
 
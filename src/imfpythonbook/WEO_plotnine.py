@@ -1,3 +1,5 @@
+from copy import deepcopy
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -10,24 +12,9 @@ from plotnine import (
 )
 
 # ---- WEO color palette and sizing ----
-def rgb2(red, green, blue):
-    """Convert RGB values (0-255) to hex color."""
-    return '#{:02x}{:02x}{:02x}'.format(red, green, blue)
-
-blue        = rgb2(0, 98, 175)
-red         = rgb2(170, 31, 76)
-gold        = rgb2(245, 189, 71)
-green       = rgb2(73, 117, 39)
-light_grey  = rgb2(200, 200, 200)
-light_blue  = rgb2(141, 163, 210)
-light_red   = rgb2(209, 145, 131)
-light_gold  = rgb2(249, 219, 161)
-light_green = rgb2(162, 176, 143)
-dark_grey   = rgb2(150, 150, 150)
-black       = rgb2(0, 0, 0)
-
-weo_colors = [blue, red, gold, green, light_grey, light_blue, light_red,
-              light_gold, light_green, dark_grey]
+# WEO palette and break helpers (shared with WEO_matplotlib)
+from ._weo_core import *
+from ._weo_core import _TICK_DEFAULTS
 
 # Font and sizing
 primary_font_weo = 'Arial'
@@ -37,6 +24,7 @@ weo_text_size    = 8
 
 def set_weo_theme_plotnine():
     """Return a plotnine theme approximating the WEO matplotlib theme, without axis lines."""
+    # Built fresh: a single theme(...) call is cheaper than deep-copying a cached one
     return theme(
         # Font & text
         text=element_text(family=primary_font_weo, size=weo_text_size, color='black'),
@@ -75,6 +63,11 @@ def set_weo_theme_plotnine():
     )
 
 def set_weo_panel_theme_plotnine():
+    # Copy so that `t += theme(...)` on the result cannot modify the cached theme
+    return deepcopy(_build_weo_panel_theme_plotnine())
+
+@lru_cache(maxsize=1)
+def _build_weo_panel_theme_plotnine():
     base = set_weo_theme_plotnine()
     return base + theme(
         plot_title=element_text(size=8, weight='bold', hjust=0, color=blue),
@@ -88,69 +81,64 @@ def set_weo_panel_theme_plotnine():
         strip_text_x=element_text(size=8, color='black', hjust=0, weight='bold'),
     )
 
-# ---- break generation (same as original) ----
-def generate_minor_breaks(major_breaks):
-    major = np.asarray(major_breaks)
-    return (major[:-1] + np.diff(major) / 2).tolist()
-
-def generate_breaks_auto(y, major_by=None):
-    y = np.asarray(y)
-    y = y[~np.isnan(y)]
-    if y.size == 0:
-        return {'major': [], 'minor': [], 'limits': [0, 1]}
-    y_min, y_max = y.min(), y.max()
-    y_span = y_max - y_min
-    if major_by is None:
-        if y_span <= 5:
-            major_by = 1
-        elif y_span <= 10:
-            major_by = 2
-        elif y_span <= 20:
-            major_by = 5
-        elif y_span <= 50:
-            major_by = 10
-        else:
-            major_by = 20
-    min_y = np.floor(y_min / major_by) * major_by
-    max_y = np.ceil(y_max / major_by) * major_by
-    major = np.arange(min_y, max_y + major_by, major_by)
-    minor = generate_minor_breaks(major)
-    return {'major': major.tolist(), 'minor': minor, 'limits': [min_y, max_y]}
-
 def make_y_tick_segments(major_breaks, minor_breaks, x_min, x_max, style='default'):
     """Create DataFrame of major and minor y-axis inward ticks (left and right)."""
-    if style.lower() == 'bar':
-        major_length = 0.10
-        minor_length = 0.06
-    else:
-        major_length = 0.15
-        minor_length = 0.10
+    major_length, minor_length = _TICK_DEFAULTS.get(style.lower(), _TICK_DEFAULTS['default'])
 
     major_size = 0.4
     minor_size = 0.3
 
-    rows = []
-    for y in minor_breaks:
-        rows.append({'x': x_min, 'xend': x_min + minor_length, 'y': y, 'yend': y, 'size': minor_size})
-        rows.append({'x': x_max - minor_length, 'xend': x_max, 'y': y, 'yend': y, 'size': minor_size})
-    for y in major_breaks:
-        rows.append({'x': x_min, 'xend': x_min + major_length, 'y': y, 'yend': y, 'size': major_size})
-        rows.append({'x': x_max - major_length, 'xend': x_max, 'y': y, 'yend': y, 'size': major_size})
-    return pd.DataFrame(rows)
+    # Column-wise: minor left, minor right, major left, major right
+    minor = np.asarray(minor_breaks, dtype=np.float64)
+    major = np.asarray(major_breaks, dtype=np.float64)
+    nm, nM = minor.size, major.size
+    y = np.concatenate([minor, minor, major, major])
+    x = np.concatenate([
+        np.full(nm, x_min), np.full(nm, x_max - minor_length),
+        np.full(nM, x_min), np.full(nM, x_max - major_length),
+    ])
+    xend = np.concatenate([
+        np.full(nm, x_min + minor_length), np.full(nm, x_max),
+        np.full(nM, x_min + major_length), np.full(nM, x_max),
+    ])
+    size = np.concatenate([np.full(2 * nm, minor_size), np.full(2 * nM, major_size)])
+    return pd.DataFrame({'x': x, 'xend': xend, 'y': y, 'yend': y, 'size': size})
+
+def make_y_tick_segments_faceted(major_breaks, minor_breaks, x_min, x_max, labels,
+                                 style='default', label_column='country_label'):
+    """
+    Repeat the y-axis tick segments once per facet in a single long DataFrame.
+
+    Equivalent to concatenating ``make_y_tick_segments(...).assign(**{label_column: label})``
+    for every label, but built with one ``np.tile``/``np.repeat`` allocation.
+    """
+    segs = make_y_tick_segments(major_breaks, minor_breaks, x_min, x_max, style)
+    n, k = len(segs), len(labels)
+    out = pd.DataFrame({c: np.tile(segs[c].to_numpy(), k) for c in segs.columns})
+    out[label_column] = np.repeat(np.asarray(labels), n)
+    return out
 
 def make_x_major_tick_segments(x_breaks, y_min, y_max, tick_length_fraction=0.02, size=0.4):
     """Create vertical inward major tick segments for X axis at bottom."""
     tick_length = tick_length_fraction * (y_max - y_min)
-    rows = []
-    for x in x_breaks:
-        rows.append({
-            'x': x,
-            'xend': x,
-            'y': y_min,
-            'yend': y_min + tick_length,
-            'size': size
-        })
-    return pd.DataFrame(rows)
+    x = np.asarray(x_breaks, dtype=np.float64)
+    return pd.DataFrame({
+        'x': x,
+        'xend': x,
+        'y': np.full(x.size, y_min),
+        'yend': np.full(x.size, y_min + tick_length),
+        'size': np.full(x.size, size),
+    })
+
+@lru_cache(maxsize=32)
+def _forecast_frame(start_year, end_year, ymin, ymax):
+    # Shared across identical shading layers; plotnine only reads layer data
+    return pd.DataFrame({
+        'xmin': np.array([start_year]),
+        'xmax': np.array([end_year]),
+        'ymin': np.array([ymin]),
+        'ymax': np.array([ymax]),
+    })
 
 def add_forecast_shading_plotnine(start_year, end_year, y_range, fill_color=light_grey, alpha=0.3):
     """
@@ -173,17 +161,9 @@ def add_forecast_shading_plotnine(start_year, end_year, y_range, fill_color=ligh
     -------
     plotnine layer (geom_rect)
     """
-    import pandas as pd
-    from plotnine import aes, geom_rect
-
-    df = pd.DataFrame({
-        'xmin': [start_year],
-        'xmax': [end_year],
-        'ymin': [y_range[0]],
-        'ymax': [y_range[1]],
-    })
+    ymin, ymax = y_range
     return geom_rect(
-        data=df,
+        data=_forecast_frame(start_year, end_year, float(ymin), float(ymax)),
         mapping=aes(xmin='xmin', xmax='xmax', ymin='ymin', ymax='ymax'),
         inherit_aes=False,
         fill=fill_color,
@@ -309,12 +289,9 @@ def add_forecast_shading_plotnine(start_year, end_year, y_range, fill_color=ligh
 #     breaks = generate_breaks_auto(combined)
 
 #     # y-axis tick segments per facet (attach country_label)
-#     y_tick_segs_base = make_y_tick_segments(
-#         breaks['major'], breaks['minor'], years.min(), years.max(), style='default'
-#     )
-#     y_tick_segs = pd.concat(
-#         [y_tick_segs_base.assign(country_label=country_labels[c]) for c in countries],
-#         ignore_index=True
+#     y_tick_segs = make_y_tick_segments_faceted(
+#         breaks['major'], breaks['minor'], years.min(), years.max(),
+#         [country_labels[c] for c in countries], style='default'
 #     )
 
 #     # x-axis major ticks per facet
@@ -14,13 +14,22 @@ The package exposes four modules:
 
 Import the modules directly from the package and consult their docstrings for
 details and examples.
+
+The modules (and the ``colors``/``matplotlib``/``plotnine`` aliases below) are
+loaded lazily on first attribute access, so ``import imfpythonbook`` does not
+pull in Plotnine unless a Plotnine helper is actually used.
 """
 
+import importlib
+from types import SimpleNamespace
+
 # Expose the individual modules at the top level for convenience
-from . import IMF_matplotlib
-from . import IMF_plotnine
-from . import WEO_matplotlib
-from . import WEO_plotnine
+_SUBMODULES = {
+    "IMF_matplotlib",
+    "IMF_plotnine",
+    "WEO_matplotlib",
+    "WEO_plotnine",
+}
 
 __all__ = [
     "IMF_matplotlib",
@@ -30,39 +39,69 @@ __all__ = [
 ]
 
 # ---- Ergonomic aliases (short, stable API) ----
-from types import SimpleNamespace
 
 # 1) Unified colors (reuse the IMF_matplotlib palette everywhere)
-colors = SimpleNamespace(
-    blue=IMF_matplotlib.blue,
-    green=IMF_matplotlib.green,
-    red=IMF_matplotlib.red,
-    grey=IMF_matplotlib.grey,
-    light_green=IMF_matplotlib.light_green,
-    light_grey=IMF_matplotlib.light_grey,
-    light_red=IMF_matplotlib.light_red,
-    dark_red=IMF_matplotlib.dark_red,
-    light_blue=IMF_matplotlib.light_blue,
-    dark_blue=IMF_matplotlib.dark_blue,
-    purple=IMF_matplotlib.purple,
-    orange=IMF_matplotlib.orange,
-)
+def _colors():
+    from . import IMF_matplotlib
+    return SimpleNamespace(
+        blue=IMF_matplotlib.blue,
+        green=IMF_matplotlib.green,
+        red=IMF_matplotlib.red,
+        grey=IMF_matplotlib.grey,
+        light_green=IMF_matplotlib.light_green,
+        light_grey=IMF_matplotlib.light_grey,
+        light_red=IMF_matplotlib.light_red,
+        dark_red=IMF_matplotlib.dark_red,
+        light_blue=IMF_matplotlib.light_blue,
+        dark_blue=IMF_matplotlib.dark_blue,
+        purple=IMF_matplotlib.purple,
+        orange=IMF_matplotlib.orange,
+    )
 
 # 2) Short Matplotlib facade
-matplotlib = SimpleNamespace(
-    set_imf_theme=IMF_matplotlib.set_imf_theme,
-    set_imf_panel_theme=IMF_matplotlib.set_imf_panel_theme,
-    set_titles=IMF_matplotlib.apply_imf_titles,
-    set_panel_titles=IMF_matplotlib.apply_imf_panel_titles,
-)
+def _matplotlib():
+    from . import IMF_matplotlib
+    return SimpleNamespace(
+        set_imf_theme=IMF_matplotlib.set_imf_theme,
+        set_imf_panel_theme=IMF_matplotlib.set_imf_panel_theme,
+        imf_theme_context=IMF_matplotlib.imf_theme_context,
+        imf_panel_theme_context=IMF_matplotlib.imf_panel_theme_context,
+        set_titles=IMF_matplotlib.apply_imf_titles,
+        set_panel_titles=IMF_matplotlib.apply_imf_panel_titles,
+    )
 
 # 3) Short Plotnine facade
-plotnine = SimpleNamespace(
-    set_imf_theme=IMF_plotnine.set_imf_theme_plotnine,
-    set_imf_panel_theme=IMF_plotnine.set_imf_panel_theme_plotnine,
-    set_titles=IMF_plotnine.apply_imf_titles_plotnine,
-    set_panel_titles=IMF_plotnine.apply_imf_panel_titles_plotnine,
-)
+def _plotnine():
+    from . import IMF_plotnine
+    return SimpleNamespace(
+        set_imf_theme=IMF_plotnine.set_imf_theme_plotnine,
+        set_imf_panel_theme=IMF_plotnine.set_imf_panel_theme_plotnine,
+        set_titles=IMF_plotnine.apply_imf_titles_plotnine,
+        set_panel_titles=IMF_plotnine.apply_imf_panel_titles_plotnine,
+    )
+
+_ALIASES = {
+    "colors": _colors,
+    "matplotlib": _matplotlib,
+    "plotnine": _plotnine,
+}
 
 # Export new aliases (keep legacy API intact)
 __all__ += ["colors", "matplotlib", "plotnine"]
+
+
+def __getattr__(name):
+    # PEP 562: build modules and aliases on first access, then cache them as
+    # module globals so later lookups bypass this function.
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _ALIASES:
+        value = _ALIASES[name]()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
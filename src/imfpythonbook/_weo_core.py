@@ -0,0 +1,98 @@
+"""
+Shared WEO building blocks for :mod:`imfpythonbook.WEO_matplotlib` and
+:mod:`imfpythonbook.WEO_plotnine`: the colour palette and the y-axis break
+helpers. Both WEO modules re-export the public names defined here.
+"""
+
+from bisect import bisect_left
+from functools import lru_cache
+import math
+import numpy as np
+
+# typed=True: 75 and 75.0 must not share a cache entry
+@lru_cache(maxsize=256, typed=True)
+def rgb2(red, green, blue):
+    """Convert RGB values (0-255) to hex color."""
+    return '#%02x%02x%02x' % (red, green, blue)
+
+# ---- WEO color palette ----
+# Colour name -> (red, green, blue), 0-255
+_PALETTE = {
+    'blue':        (0, 98, 175),
+    'red':         (170, 31, 76),
+    'gold':        (245, 189, 71),
+    'green':       (73, 117, 39),
+    'light_grey':  (200, 200, 200),
+    'light_blue':  (141, 163, 210),
+    'light_red':   (209, 145, 131),
+    'light_gold':  (249, 219, 161),
+    'light_green': (162, 176, 143),
+    'dark_grey':   (150, 150, 150),
+    'black':       (0, 0, 0),
+}
+
+(blue, red, gold, green, light_grey, light_blue, light_red,
+ light_gold, light_green, dark_grey, black) = (
+    rgb2(*rgb) for rgb in _PALETTE.values()
+)
+
+weo_colors = [blue, red, gold, green, light_grey, light_blue, light_red,
+              light_gold, light_green, dark_grey]
+
+# ---- break generation ----
+def _as_f64(a):
+    """Return ``a`` as a float64 ndarray, without a conversion call if it already is one."""
+    if isinstance(a, np.ndarray) and a.dtype == np.float64:
+        return a
+    return np.asarray(a, dtype=np.float64)
+
+def generate_minor_breaks(major_breaks):
+    """Generate one minor break between each pair of major breaks, as an ndarray."""
+    major = _as_f64(major_breaks)
+    return 0.5 * (major[:-1] + major[1:])
+
+# Major break step by data span, used when major_by is not given
+_SPAN_THRESHOLDS = (5, 10, 20, 50)
+_MAJORS = (1, 2, 5, 10, 20)
+
+def _breaks_from_range(y_min, y_max, major_by=None):
+    """Return rounded (major, min_y, max_y) breaks for the range [y_min, y_max]."""
+    if major_by is None:
+        # First threshold >= span picks the step: span <= 5 -> 1, ..., span > 50 -> 20
+        major_by = _MAJORS[bisect_left(_SPAN_THRESHOLDS, y_max - y_min)]
+    # Scalars: math.floor/ceil avoid NumPy scalar boxing
+    min_y = float(math.floor(y_min / major_by) * major_by)
+    max_y = float(math.ceil(y_max / major_by) * major_by)
+    major = np.arange(min_y, max_y + major_by, major_by, dtype=np.float64)
+    return major, min_y, max_y
+
+def generate_breaks_auto(y, major_by=None):
+    """Generate clean major and minor breaks from Y data range."""
+    # The masked path in generate_breaks_auto_2d handles input of any shape
+    return generate_breaks_auto_2d(y, major_by)
+
+def generate_breaks_auto_2d(Y, major_by=None):
+    """Generate breaks from a 2D (series x periods) array without flattening it.
+
+    Any other shape works too; :func:`generate_breaks_auto` delegates here.
+    Store per-country series once as ``np.stack([data[c] for c in countries])``
+    and pass the stacked array here instead of concatenating on every call.
+    """
+    Y = _as_f64(Y)
+    finite = np.isfinite(Y)
+    # Masked reductions scan the block in place; no filtered copy is made
+    y_min = float(np.min(Y, where=finite, initial=np.inf))
+    y_max = float(np.max(Y, where=finite, initial=-np.inf))
+    if y_min > y_max:  # no finite values
+        return {'major': [], 'minor': np.empty(0), 'limits': [0, 1]}
+    major, min_y, max_y = _breaks_from_range(y_min, y_max, major_by)
+    minor = generate_minor_breaks(major)
+    return {'major': major.tolist(), 'minor': minor, 'limits': [min_y, max_y]}
+
+# Default (major, minor) y-tick lengths by chart style, in x-axis data units
+_TICK_DEFAULTS = {'bar': (0.10, 0.06), 'default': (0.15, 0.10)}
+
+__all__ = [
+    'rgb2', *_PALETTE, 'weo_colors',
+    'generate_minor_breaks', 'generate_breaks_auto', 'generate_breaks_auto_2d',
+]